@@ -1,8 +1,10 @@
 """Quercle tools for Pydantic AI agents."""
 
+from quercle_pydantic_ai._runtime import install_uvloop
 from quercle_pydantic_ai.tools import (
     QuercleToolset,
     quercle_extract_tool,
+    quercle_fetch_many_tool,
     quercle_fetch_tool,
     quercle_raw_fetch_tool,
     quercle_raw_search_tool,
@@ -14,7 +16,9 @@ __version__ = "1.0.0"
 
 __all__ = [
     "QuercleToolset",
+    "install_uvloop",
     "quercle_extract_tool",
+    "quercle_fetch_many_tool",
     "quercle_fetch_tool",
     "quercle_raw_fetch_tool",
     "quercle_raw_search_tool",
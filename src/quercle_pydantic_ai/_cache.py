@@ -0,0 +1,220 @@
+"""Result caching and request coalescing helpers shared by the Quercle tools."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit, urlunsplit
+
+from cachetools import TTLCache
+
+if TYPE_CHECKING:
+    from diskcache import Cache
+
+DEFAULT_CACHE_TTL = 600.0
+DEFAULT_CACHE_MAXSIZE = 256
+
+
+class _SearchCache:
+    """In-process LRU cache of tool results with a time-to-live.
+
+    A ``ttl`` or ``maxsize`` of 0 disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        self._cache: TTLCache[Hashable, str] | None = (
+            TTLCache(maxsize=maxsize, ttl=ttl) if ttl > 0 and maxsize > 0 else None
+        )
+        # Tools may be shared between event loops running in different threads
+        # (e.g. ``agent.run_sync`` from a thread pool), so guard with a thread lock.
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None
+
+    def get(self, key: Hashable) -> str | None:
+        if self._cache is None:
+            return None
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: Hashable, value: str) -> None:
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache[key] = value
+
+    def clear(self) -> None:
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache.clear()
+
+    async def get_or_call(self, key: Hashable, call: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached value for ``key``, awaiting ``call()`` on a miss."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        result = await call()
+        self.set(key, result)
+        return result
+
+
+class _SingleFlight:
+    """Coalesce concurrent calls with the same key into a single in-flight request.
+
+    The first caller for a key starts ``call()`` as a task; callers arriving while it is
+    still running await the same result (or exception) instead of issuing their own
+    request. Every caller awaits the task through a shield, so cancelling one caller
+    doesn't cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[str]] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[str]]) -> str:
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future[str]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved so it isn't logged when every caller left.
+        if not task.cancelled():
+            task.exception()
+
+
+# diskcache opens an SQLite connection per thread and ``Cache.close()`` only closes the
+# calling thread's, so disk reads and writes all run on this one thread rather than on
+# ``asyncio.to_thread``'s pool, leaving each cache with a connection ``close`` can reach.
+_DISK_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quercle-disk-cache")
+
+
+def _open_disk_cache(directory: str | os.PathLike[str]) -> Cache:
+    """Return the persistent result cache stored in ``directory``, creating it if needed.
+
+    Toolsets pointed at the same directory share one ``Cache`` instance.
+    """
+    return _disk_cache_at(os.path.realpath(os.fspath(directory)))
+
+
+@functools.lru_cache(maxsize=None)
+def _disk_cache_at(path: str) -> Cache:
+    try:
+        from diskcache import Cache
+    except ImportError as exc:
+        raise ImportError(
+            'cache_dir requires the "disk" extra: pip install "quercle-pydantic-ai[disk]"'
+        ) from exc
+    return Cache(path)
+
+
+def _close_disk_cache(cache: Cache) -> None:
+    """Close the cache's connections on the disk I/O thread and the calling thread.
+
+    The cache reconnects on its next use, so closing one shared by several toolsets
+    is safe.
+    """
+    _DISK_EXECUTOR.submit(cache.close).result()
+    cache.close()
+
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize cosmetic URL differences: scheme/host case, default port, fragment."""
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return url
+    host = parts.hostname
+    if ":" in host:
+        host = f"[{host}]"
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+    userinfo, _, _ = parts.netloc.rpartition("@")
+    netloc = f"{userinfo}@{host}" if userinfo else host
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+def _canonical_value(name: str, value: Any) -> Any:
+    if value is None:
+        # The API defaults every ``format`` to markdown.
+        return "markdown" if name == "format" else None
+    if name == "url":
+        return _canonical_url(value)
+    if name.endswith("_domains"):
+        return sorted({domain.strip().lower() for domain in value})
+    if name == "format":
+        return str(value).lower()
+    if name == "use_safeguard":
+        return bool(value)
+    return value
+
+
+def _canonical_params(**params: Any) -> dict[str, Any]:
+    """Normalize tool arguments the way ``_canonical_key`` does."""
+    return {name: _canonical_value(name, value) for name, value in params.items()}
+
+
+def _canonical_key(
+    tool: str, fixed: Mapping[str, Any] | None = None, /, **params: Any
+) -> bytes:
+    """Return a compact digest identifying a tool call, for use as a cache key.
+
+    Arguments are normalized first so cosmetic differences (e.g. ``HTTPS://Example.com/``
+    vs ``https://example.com``, or reordered domain lists) map to the same key.
+    ``fixed`` holds arguments already normalized with ``_canonical_params``, e.g. a
+    tool's configuration, so they aren't normalized again on every call.
+    """
+    canonical = _canonical_params(**params)
+    if fixed:
+        canonical.update(fixed)
+    payload = json.dumps(
+        [tool, canonical], sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+async def _disk_cached(
+    cache: Cache,
+    key: bytes,
+    ttl: float,
+    call: Callable[[], Awaitable[str]],
+) -> str:
+    """Return the persisted result for ``key``, awaiting ``call()`` on a miss.
+
+    The cache is SQLite-backed, so reads and writes run on the disk I/O thread to keep
+    them off the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    cached = await loop.run_in_executor(_DISK_EXECUTOR, cache.get, key)
+    if cached is not None:
+        return cached
+    result = await call()
+    await loop.run_in_executor(
+        _DISK_EXECUTOR, functools.partial(cache.set, key, result, expire=ttl)
+    )
+    return result
@@ -0,0 +1,120 @@
+"""Offline test helpers for code using Quercle tools.
+
+Example:
+    >>> from quercle_pydantic_ai import tools
+    >>> from quercle_pydantic_ai.testing import InMemoryQuercleClient
+    >>> fake = InMemoryQuercleClient({("search", "What is Python?"): "A language."})
+    >>> tools.client_factory = fake.factory
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, cast
+
+import httpx
+from quercle import AsyncQuercleClient
+from quercle.models import (
+    ExtractBodyFormat,
+    ExtractResponse200Type0,
+    ExtractResponse200Type1,
+    FetchResponse200,
+    RawFetchBodyFormat,
+    RawFetchResponse200,
+    RawSearchBodyFormat,
+    RawSearchResponse200Type0,
+    RawSearchResponse200Type1,
+    SearchResponse200,
+)
+
+
+class InMemoryQuercleClient:
+    """Offline stand-in for ``AsyncQuercleClient`` with deterministic responses.
+
+    Responses are looked up by ``(operation, *arguments)``, e.g. ``("search", query)``,
+    ``("fetch", url, prompt)``, ``("raw_fetch", url)``, ``("raw_search", query)`` or
+    ``("extract", url, query)``. Requests without a configured response get a
+    deterministic placeholder, which is memoized so repeated calls return the same
+    result. Every request key is recorded in ``calls``.
+    """
+
+    def __init__(self, responses: Mapping[tuple[str, ...], Any] | None = None) -> None:
+        """Initialize the client.
+
+        Args:
+            responses: Results to return, keyed by ``(operation, *arguments)``. Use a
+                list for JSON-format raw search and extract results.
+        """
+        self.responses: dict[tuple[str, ...], Any] = dict(responses or {})
+        self.calls: list[tuple[str, ...]] = []
+
+    def factory(
+        self,
+        api_key: str | None = None,
+        timeout: float | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ) -> AsyncQuercleClient:
+        """A ``tools.client_factory`` that always returns this client."""
+        return cast(AsyncQuercleClient, self)
+
+    def _respond(self, key: tuple[str, ...]) -> Any:
+        self.calls.append(key)
+        if key not in self.responses:
+            self.responses[key] = f"{key[0]} result for {' | '.join(key[1:])}"
+        return self.responses[key]
+
+    async def search(
+        self,
+        query: str,
+        *,
+        allowed_domains: list[str] | None = None,
+        blocked_domains: list[str] | None = None,
+        timeout: float | None = None,
+    ) -> SearchResponse200:
+        return SearchResponse200(result=self._respond(("search", query)))
+
+    async def fetch(
+        self, url: str, prompt: str, *, timeout: float | None = None
+    ) -> FetchResponse200:
+        return FetchResponse200(result=self._respond(("fetch", url, prompt)))
+
+    async def raw_fetch(
+        self,
+        url: str,
+        *,
+        format: RawFetchBodyFormat | None = None,
+        use_safeguard: bool | None = None,
+        timeout: float | None = None,
+    ) -> RawFetchResponse200:
+        return RawFetchResponse200(result=self._respond(("raw_fetch", url)))
+
+    async def raw_search(
+        self,
+        query: str,
+        *,
+        format: RawSearchBodyFormat | None = None,
+        use_safeguard: bool | None = None,
+        timeout: float | None = None,
+    ) -> RawSearchResponse200Type0 | RawSearchResponse200Type1:
+        result = self._respond(("raw_search", query))
+        if isinstance(result, list):
+            return RawSearchResponse200Type1(result=result, unsafe=False)
+        return RawSearchResponse200Type0(result=result, unsafe=False)
+
+    async def extract(
+        self,
+        url: str,
+        query: str,
+        *,
+        format: ExtractBodyFormat | None = None,
+        use_safeguard: bool | None = None,
+        timeout: float | None = None,
+    ) -> ExtractResponse200Type0 | ExtractResponse200Type1:
+        result = self._respond(("extract", url, query))
+        if isinstance(result, list):
+            return ExtractResponse200Type1(result=result, unsafe=False)
+        return ExtractResponse200Type0(result=result, unsafe=False)
+
+    async def aclose(self) -> None:
+        pass
@@ -2,416 +2,898 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
 import json
-from typing import Any
+import os
+import sys
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+import httpx
+from attrs import evolve
 from pydantic_ai.tools import Tool
 from pydantic_ai.toolsets import FunctionToolset
 from quercle import (
     AsyncQuercleClient,
+    QuercleApiError,
     tool_metadata,
 )
 from quercle.models import ExtractBodyFormat, RawFetchBodyFormat, RawSearchBodyFormat
 
+from quercle_pydantic_ai._cache import (
+    DEFAULT_CACHE_MAXSIZE,
+    DEFAULT_CACHE_TTL,
+    _canonical_key,
+    _canonical_params,
+    _close_disk_cache,
+    _disk_cached,
+    _open_disk_cache,
+    _SearchCache,
+    _SingleFlight,
+)
 
-def quercle_search_tool(
-    api_key: str | None = None,
-    allowed_domains: list[str] | None = None,
-    blocked_domains: list[str] | None = None,
-    timeout: float | None = None,
-) -> Tool[Any]:
-    """Create a Quercle web search tool for Pydantic AI agents.
+if TYPE_CHECKING:
+    from diskcache import Cache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+# The SDK's tool metadata as ``(description, parameter descriptions)``, read once at
+# import. Strings are interned so every tool instance shares a single copy.
+_META: dict[str, tuple[str, dict[str, str]]] = {
+    name: (
+        sys.intern(meta["description"]),
+        {param: sys.intern(text) for param, text in meta["parameters"].items()},
+    )
+    for name, meta in tool_metadata.items()
+}
+
+# Tool docstrings and descriptions are built once from the SDK's metadata.
+_SEARCH_DESC = _META["search"][0]
+_SEARCH_DOC = f"""Search the web and get AI-synthesized answers with citations.
 
     Args:
-        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
-        allowed_domains: Only include results from these domains.
-        blocked_domains: Exclude results from these domains.
-        timeout: Request timeout in seconds.
+        query: {_META["search"][1]["query"]}
 
     Returns:
-        A Pydantic AI Tool configured for web search.
+        AI-synthesized answer with source citations.
     """
-    client: AsyncQuercleClient | None = None
-
-    async def quercle_search(query: str) -> str:
-        nonlocal client
-        if client is None:
-            client = AsyncQuercleClient(api_key=api_key)
-        return (await client.search(
-            query,
-            allowed_domains=allowed_domains,
-            blocked_domains=blocked_domains,
-            timeout=timeout,
-        )).result
 
-    # Set docstring dynamically using imported descriptions
-    quercle_search.__doc__ = f"""Search the web and get AI-synthesized answers with citations.
+_FETCH_DESC = _META["fetch"][0]
+_FETCH_DOC = f"""Fetch a URL and analyze its content with AI.
 
     Args:
-        query: {tool_metadata["search"]["parameters"]["query"]}
+        url: {_META["fetch"][1]["url"]}
+        prompt: {_META["fetch"][1]["prompt"]}
 
     Returns:
-        AI-synthesized answer with source citations.
+        AI-processed analysis of the page content.
     """
 
-    return Tool(
-        quercle_search,
-        name="quercle_search",
-        description=tool_metadata["search"]["description"],
-        takes_ctx=False,
-    )
+_RAW_FETCH_DESC = _META["raw_fetch"][0]
+_RAW_FETCH_DOC = f"""Fetch a URL and return raw markdown or HTML.
 
+    Args:
+        url: {_META["raw_fetch"][1]["url"]}
+        format: {_META["raw_fetch"][1]["format"]}
+        use_safeguard: {_META["raw_fetch"][1]["use_safeguard"]}
 
-def quercle_fetch_tool(
-    api_key: str | None = None,
-    timeout: float | None = None,
-) -> Tool[Any]:
-    """Create a Quercle URL fetch tool for Pydantic AI agents.
+    Returns:
+        Raw page content in the requested format.
+    """
+
+_RAW_SEARCH_DESC = _META["raw_search"][0]
+_RAW_SEARCH_DOC = f"""Run web search and return raw results.
 
     Args:
-        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
-        timeout: Request timeout in seconds.
+        query: {_META["raw_search"][1]["query"]}
+        format: {_META["raw_search"][1]["format"]}
+        use_safeguard: {_META["raw_search"][1]["use_safeguard"]}
 
     Returns:
-        A Pydantic AI Tool configured for URL fetching.
+        Raw search results in the requested format.
     """
-    client: AsyncQuercleClient | None = None
 
-    async def quercle_fetch(url: str, prompt: str) -> str:
-        nonlocal client
-        if client is None:
-            client = AsyncQuercleClient(api_key=api_key)
-        return (await client.fetch(url=url, prompt=prompt, timeout=timeout)).result
+_EXTRACT_DESC = _META["extract"][0]
+_EXTRACT_DOC = f"""Fetch a URL and return chunks relevant to a query.
 
-    # Set docstring dynamically using imported descriptions
-    quercle_fetch.__doc__ = f"""Fetch a URL and analyze its content with AI.
+    Args:
+        url: {_META["extract"][1]["url"]}
+        query: {_META["extract"][1]["query"]}
+        format: {_META["extract"][1]["format"]}
+        use_safeguard: {_META["extract"][1]["use_safeguard"]}
+
+    Returns:
+        Extracted content chunks relevant to the query.
+    """
+
+_FETCH_MANY_DESC = (
+    "Fetch several URLs in parallel and return an AI-synthesized answer for each, "
+    "based on its page content and your prompt."
+)
+_FETCH_MANY_DOC = f"""Fetch several URLs and analyze each page's content with AI.
 
     Args:
-        url: {tool_metadata["fetch"]["parameters"]["url"]}
-        prompt: {tool_metadata["fetch"]["parameters"]["prompt"]}
+        urls: The URLs to fetch and analyze.
+        prompt: {_META["fetch"][1]["prompt"]}
 
     Returns:
-        AI-processed analysis of the page content.
+        JSON list with a ``{{"url", "result"}}`` or ``{{"url", "error"}}`` object per URL,
+        in the order given.
     """
 
-    return Tool(
-        quercle_fetch,
-        name="quercle_fetch",
-        description=tool_metadata["fetch"]["description"],
-        takes_ctx=False,
-    )
+_ClientGetter = Callable[[], AsyncQuercleClient]
 
 
-def quercle_raw_fetch_tool(
+def _to_jsonable(obj: Any) -> Any:
+    # Structured results contain SDK attrs models (e.g. raw search result items).
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a structured API result to compact JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_to_jsonable).decode()
+    return json.dumps(obj, default=_to_jsonable, ensure_ascii=False, separators=(",", ":"))
+
+
+def _identity(result: str) -> str:
+    return result
+
+
+# The result type follows from the requested format: ``json`` returns a list, every other
+# format (including the markdown default) returns text.
+_RESULT_TO_TEXT: dict[str | None, Callable[[Any], str]] = {"json": _dumps}
+
+
+def _response_body(response: Any) -> str:
+    """Rebuild the API's JSON response body (``result`` and ``unsafe``) from a parsed response.
+
+    Keeps ``raw_text`` output in the same shape when the body can't be passed through.
+    """
+    body: dict[str, Any] = {"result": response.result}
+    if isinstance(response.unsafe, bool):
+        body["unsafe"] = response.unsafe
+    return _dumps(body)
+
+
+def _api_error(operation: str, response: httpx.Response) -> QuercleApiError:
+    """Build the error the SDK raises for a failed response, from the raw response.
+
+    Like the SDK, ``detail`` comes from the JSON body's ``detail`` field, falling back
+    to the body text; the decoded body is passed as the payload.
+    """
+    try:
+        payload = response.json()
+    except ValueError:
+        payload = None
+    detail = payload.get("detail") if isinstance(payload, dict) else None
+    if not isinstance(detail, str) or not detail:
+        detail = response.text.strip() or "Request failed"
+    return QuercleApiError(operation, response.status_code, detail, payload)
+
+
+def _require_http2() -> None:
+    """Fail at configuration time, rather than on the first request, if h2 is missing."""
+    if importlib.util.find_spec("h2") is None:
+        raise ImportError(
+            'http2=True requires the "http2" extra: pip install "quercle-pydantic-ai[http2]"'
+        )
+
+
+def _create_client(
     api_key: str | None = None,
     timeout: float | None = None,
-) -> Tool[Any]:
-    """Create a Quercle raw URL fetch tool for Pydantic AI agents.
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+) -> AsyncQuercleClient:
+    """Create the client used by tools that weren't given one.
+
+    The timeout is configured on the client itself rather than passed per call: the
+    SDK builds a new httpx client for every call that overrides the timeout, which
+    would throw away the connection pool.
+    """
+    client = AsyncQuercleClient(api_key=api_key)
+    sdk_client = client.client
+    httpx_args: dict[str, Any] = {}
+    if limits is not None:
+        httpx_args["limits"] = limits
+    if http2:
+        httpx_args["http2"] = True
+    if httpx_args:
+        sdk_client = evolve(sdk_client, httpx_args=httpx_args)
+    if timeout is not None:
+        sdk_client = sdk_client.with_timeout(httpx.Timeout(timeout))
+    if sdk_client is client.client:
+        return client
+    return AsyncQuercleClient(client=sdk_client)
 
-    Args:
-        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
-        timeout: Request timeout in seconds.
 
-    Returns:
-        A Pydantic AI Tool configured for raw URL fetching.
+# Called as ``client_factory(api_key=..., timeout=..., limits=..., http2=...)`` whenever
+# a tool needs a client. Tests can replace it to inject a fake, e.g.
+# ``testing.InMemoryQuercleClient``.
+client_factory: Callable[..., AsyncQuercleClient] = _create_client
+
+
+class _ClientHolder:
+    """Create a client on first use in each event loop and reuse it within that loop.
+
+    httpx connections are bound to the loop that opened them, so tools used from
+    several loops (successive ``asyncio.run`` calls, ``run_sync`` in worker threads)
+    get a client per loop instead of reusing connections from a closed one.
     """
-    client: AsyncQuercleClient | None = None
 
-    async def quercle_raw_fetch(
-        url: str,
-        format: RawFetchBodyFormat | None = None,
-        use_safeguard: bool | None = None,
-    ) -> str:
-        nonlocal client
+    __slots__ = ("_clients", "_factory")
+
+    def __init__(self, factory: _ClientGetter) -> None:
+        self._clients: dict[asyncio.AbstractEventLoop | None, AsyncQuercleClient] = {}
+        self._factory = factory
+
+    def get(self) -> AsyncQuercleClient:
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        client = self._clients.get(loop)
         if client is None:
-            client = AsyncQuercleClient(api_key=api_key)
-        result = (await client.raw_fetch(
-            url,
-            format=format,
-            use_safeguard=use_safeguard,
-            timeout=timeout,
-        )).result
-        return result if isinstance(result, str) else json.dumps(result)
+            # Forget clients whose loop has closed; their connections are unusable.
+            self._clients = {
+                owner: held
+                for owner, held in self._clients.items()
+                if owner is None or not owner.is_closed()
+            }
+            client = self._clients[loop] = self._factory()
+        return client
 
-    # Set docstring dynamically using imported descriptions
-    quercle_raw_fetch.__doc__ = f"""Fetch a URL and return raw markdown or HTML.
 
-    Args:
-        url: {tool_metadata["raw_fetch"]["parameters"]["url"]}
-        format: {tool_metadata["raw_fetch"]["parameters"]["format"]}
-        use_safeguard: {tool_metadata["raw_fetch"]["parameters"]["use_safeguard"]}
+def _lazy_client(
+    api_key: str | None,
+    timeout: float | None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+    factory: Callable[..., AsyncQuercleClient] | None = None,
+) -> _ClientGetter:
+    """Return a getter that creates a client on first use and reuses it afterwards.
 
-    Returns:
-        Raw page content in the requested format.
+    Clients come from ``factory``, or from the module's ``client_factory`` at the time
+    the client is created if not given.
     """
+    return _ClientHolder(
+        lambda: (factory or client_factory)(
+            api_key=api_key, timeout=timeout, limits=limits, http2=http2
+        )
+    ).get
+
+
+def _resolve_client(
+    api_key: str | None,
+    timeout: float | None,
+    client: AsyncQuercleClient | None,
+) -> _ClientGetter:
+    """Return the client getter for a tool factory."""
+    if client is None:
+        return _lazy_client(api_key, timeout)
+    if timeout is not None:
+        # A per-call timeout makes the SDK build (and leak) a new httpx client per call,
+        # defeating the shared connection pool.
+        raise ValueError(
+            "timeout can't be combined with client; configure the timeout on the client"
+        )
+    return lambda: client
 
-    return Tool(
-        quercle_raw_fetch,
-        name="quercle_raw_fetch",
-        description=tool_metadata["raw_fetch"]["description"],
-        takes_ctx=False,
-    )
 
+class _SharedToolOptions(NamedTuple):
+    """Tool options accepted by ``quercle_tools`` and ``QuercleToolset``."""
 
-def quercle_raw_search_tool(
-    api_key: str | None = None,
-    timeout: float | None = None,
-) -> Tool[Any]:
-    """Create a Quercle raw web search tool for Pydantic AI agents.
+    allowed_domains: list[str] | None = None
+    blocked_domains: list[str] | None = None
+    cache_ttl: float = DEFAULT_CACHE_TTL
+    cache_maxsize: int = DEFAULT_CACHE_MAXSIZE
+    disk_cache: Cache | None = None
 
-    Args:
-        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
-        timeout: Request timeout in seconds.
 
-    Returns:
-        A Pydantic AI Tool configured for raw web search.
+class _QuercleCallable:
+    """Base for the coroutine callables backing each Quercle tool.
+
+    Slotted instances keep per-tool state (client getter, in-flight requests) as
+    plain attributes instead of closure cells.
     """
-    client: AsyncQuercleClient | None = None
 
-    async def quercle_raw_search(
-        query: str,
-        format: RawSearchBodyFormat | None = None,
-        use_safeguard: bool | None = None,
+    __slots__ = ("_get_client", "_inflight", "_disk_cache")
+
+    name: str
+    description: str
+    # How long results stay in the persistent cache, in seconds.
+    disk_ttl: float
+    __call__: Callable[..., Awaitable[str]]
+
+    def __init__(
+        self,
+        get_client: _ClientGetter,
+        disk_cache: Cache | None = None,
+    ) -> None:
+        self._get_client = get_client
+        self._inflight = _SingleFlight()
+        self._disk_cache = disk_cache
+
+    @classmethod
+    def from_options(
+        cls, get_client: _ClientGetter, options: _SharedToolOptions
+    ) -> _QuercleCallable:
+        """Build the callable for a shared-client tool set."""
+        return cls(get_client, disk_cache=options.disk_cache)
+
+    async def _run(self, key: bytes, call: Callable[[], Awaitable[str]]) -> str:
+        """Run ``call`` through in-flight coalescing and the persistent cache (if any).
+
+        ``key`` is the call's ``_canonical_key``. The disk cache is consulted inside the
+        coalesced call, so concurrent identical calls read and write it only once.
+        """
+        if self._disk_cache is None:
+            return await self._inflight.do(key, call)
+        disk_cache = self._disk_cache
+        return await self._inflight.do(
+            key, lambda: _disk_cached(disk_cache, key, self.disk_ttl, call)
+        )
+
+    async def _post_json_text(
+        self, operation: str, path: str, payload: dict[str, Any]
+    ) -> str | None:
+        """POST to the API through the client's connection pool and return the body as-is.
+
+        Used for JSON-format results: the SDK would parse the body into models only for
+        it to be serialized again for the model, so the original text is passed through.
+        Returns None if the client isn't an ``AsyncQuercleClient`` (e.g. a fake).
+        """
+        client = self._get_client()
+        if not isinstance(client, AsyncQuercleClient):
+            return None
+        response = await client.client.get_async_httpx_client().post(path, json=payload)
+        if response.status_code != 200:
+            raise _api_error(operation, response)
+        return response.text
+
+    def as_tool(self) -> Tool[Any]:
+        # Pass the bound ``__call__`` so Pydantic AI can read its signature, type hints
+        # and docstring like it would for a plain function.
+        return Tool(
+            self.__call__,
+            name=self.name,
+            description=self.description,
+            takes_ctx=False,
+        )
+
+
+class _SearchCallable(_QuercleCallable):
+    __slots__ = ("_search_kwargs", "_key_params", "_cache")
+
+    name = "quercle_search"
+    description = _SEARCH_DESC
+    disk_ttl = 24 * 3600
+
+    def __init__(
+        self,
+        get_client: _ClientGetter,
+        allowed_domains: list[str] | None,
+        blocked_domains: list[str] | None,
+        cache_ttl: float,
+        cache_maxsize: int,
+        disk_cache: Cache | None = None,
+    ) -> None:
+        super().__init__(get_client, disk_cache)
+        # The domain filters are fixed for the tool's lifetime, so the request arguments
+        # and their cache-key form are prepared once here.
+        self._search_kwargs: dict[str, Any] = {
+            "allowed_domains": allowed_domains,
+            "blocked_domains": blocked_domains,
+        }
+        self._key_params = _canonical_params(
+            allowed_domains=allowed_domains, blocked_domains=blocked_domains
+        )
+        self._cache = _SearchCache(maxsize=cache_maxsize, ttl=cache_ttl)
+
+    @classmethod
+    def from_options(
+        cls, get_client: _ClientGetter, options: _SharedToolOptions
+    ) -> _QuercleCallable:
+        return cls(
+            get_client,
+            options.allowed_domains,
+            options.blocked_domains,
+            options.cache_ttl,
+            options.cache_maxsize,
+            options.disk_cache,
+        )
+
+    async def _call(self, query: str) -> str:
+        return (await self._get_client().search(query, **self._search_kwargs)).result
+
+    async def __call__(self, query: str) -> str:
+        key = _canonical_key(self.name, self._key_params, query=query)
+        return await self._cache.get_or_call(
+            key, lambda: self._run(key, lambda: self._call(query))
+        )
+
+    __call__.__name__ = "quercle_search"
+    __call__.__doc__ = _SEARCH_DOC
+
+
+class _FetchCallable(_QuercleCallable):
+    __slots__ = ()
+
+    name = "quercle_fetch"
+    description = _FETCH_DESC
+    disk_ttl = 6 * 3600
+
+    async def _call(self, url: str, prompt: str) -> str:
+        return (await self._get_client().fetch(
+            url=url, prompt=prompt
+        )).result
+
+    async def __call__(self, url: str, prompt: str) -> str:
+        return await self._run(
+            _canonical_key(self.name, url=url, prompt=prompt),
+            lambda: self._call(url, prompt),
+        )
+
+    __call__.__name__ = "quercle_fetch"
+    __call__.__doc__ = _FETCH_DOC
+
+
+class _FetchManyCallable:
+    """Callable backing ``quercle_fetch_many``: a bounded fan-out over a fetch tool."""
+
+    __slots__ = ("_fetch", "_max_concurrency")
+
+    name = "quercle_fetch_many"
+    description = _FETCH_MANY_DESC
+
+    def __init__(self, fetch: _FetchCallable, max_concurrency: int = 8) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        # Each URL goes through a regular fetch so it shares its caching and coalescing.
+        self._fetch = fetch
+        self._max_concurrency = max_concurrency
+
+    async def __call__(self, urls: list[str], prompt: str) -> str:
+        # The API has no batch endpoint, so the URLs are fetched concurrently instead.
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch_one(url: str) -> dict[str, str]:
+            async with semaphore:
+                try:
+                    return {"url": url, "result": await self._fetch(url, prompt)}
+                except (QuercleApiError, httpx.HTTPError) as exc:
+                    return {"url": url, "error": str(exc) or type(exc).__name__}
+
+        return _dumps(await asyncio.gather(*map(fetch_one, urls)))
+
+    __call__.__name__ = "quercle_fetch_many"
+    __call__.__doc__ = _FETCH_MANY_DOC
+
+    def as_tool(self) -> Tool[Any]:
+        return Tool(
+            self.__call__,
+            name=self.name,
+            description=self.description,
+            takes_ctx=False,
+        )
+
+
+class _RawFetchCallable(_QuercleCallable):
+    __slots__ = ()
+
+    name = "quercle_raw_fetch"
+    description = _RAW_FETCH_DESC
+    disk_ttl = 6 * 3600
+
+    async def _call(
+        self,
+        url: str,
+        format: RawFetchBodyFormat | None,
+        use_safeguard: bool | None,
     ) -> str:
-        nonlocal client
-        if client is None:
-            client = AsyncQuercleClient(api_key=api_key)
-        result = (await client.raw_search(
-            query,
+        # html and markdown results are always text.
+        return (await self._get_client().raw_fetch(
+            url,
             format=format,
             use_safeguard=use_safeguard,
-            timeout=timeout,
         )).result
-        return result if isinstance(result, str) else json.dumps(result)
 
-    # Set docstring dynamically using imported descriptions
-    quercle_raw_search.__doc__ = f"""Run web search and return raw results.
+    async def __call__(
+        self,
+        url: str,
+        format: RawFetchBodyFormat | None = None,
+        use_safeguard: bool | None = None,
+    ) -> str:
+        return await self._run(
+            _canonical_key(self.name, url=url, format=format, use_safeguard=use_safeguard),
+            lambda: self._call(url, format, use_safeguard),
+        )
 
-    Args:
-        query: {tool_metadata["raw_search"]["parameters"]["query"]}
-        format: {tool_metadata["raw_search"]["parameters"]["format"]}
-        use_safeguard: {tool_metadata["raw_search"]["parameters"]["use_safeguard"]}
+    __call__.__name__ = "quercle_raw_fetch"
+    __call__.__doc__ = _RAW_FETCH_DOC
 
-    Returns:
-        Raw search results in the requested format.
-    """
 
-    return Tool(
-        quercle_raw_search,
-        name="quercle_raw_search",
-        description=tool_metadata["raw_search"]["description"],
-        takes_ctx=False,
-    )
+class _RawSearchCallable(_QuercleCallable):
+    __slots__ = ("_raw_text",)
 
+    name = "quercle_raw_search"
+    description = _RAW_SEARCH_DESC
+    disk_ttl = 3600
 
-def quercle_extract_tool(
-    api_key: str | None = None,
-    timeout: float | None = None,
-) -> Tool[Any]:
-    """Create a Quercle content extraction tool for Pydantic AI agents.
+    def __init__(
+        self,
+        get_client: _ClientGetter,
+        disk_cache: Cache | None = None,
+        raw_text: bool = True,
+    ) -> None:
+        super().__init__(get_client, disk_cache)
+        self._raw_text = raw_text
+
+    async def _call(
+        self,
+        query: str,
+        format: RawSearchBodyFormat | None,
+        use_safeguard: bool | None,
+    ) -> str:
+        if self._raw_text and format == "json":
+            payload: dict[str, Any] = {"query": query, "format": format}
+            if use_safeguard is not None:
+                payload["use_safeguard"] = use_safeguard
+            text = await self._post_json_text("raw_search", "/v1/raw_search", payload)
+            if text is not None:
+                return text
+        response = await self._get_client().raw_search(
+            query,
+            format=format,
+            use_safeguard=use_safeguard,
+        )
+        if self._raw_text and format == "json":
+            return _response_body(response)
+        return _RESULT_TO_TEXT.get(format, _identity)(response.result)
 
-    Args:
-        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
-        timeout: Request timeout in seconds.
+    async def __call__(
+        self,
+        query: str,
+        format: RawSearchBodyFormat | None = None,
+        use_safeguard: bool | None = None,
+    ) -> str:
+        return await self._run(
+            _canonical_key(
+                self.name,
+                query=query,
+                format=format,
+                use_safeguard=use_safeguard,
+                raw_text=self._raw_text,
+            ),
+            lambda: self._call(query, format, use_safeguard),
+        )
 
-    Returns:
-        A Pydantic AI Tool configured for content extraction.
-    """
-    client: AsyncQuercleClient | None = None
+    __call__.__name__ = "quercle_raw_search"
+    __call__.__doc__ = _RAW_SEARCH_DOC
 
-    async def quercle_extract(
+
+class _ExtractCallable(_QuercleCallable):
+    __slots__ = ("_raw_text",)
+
+    name = "quercle_extract"
+    description = _EXTRACT_DESC
+    disk_ttl = 6 * 3600
+
+    def __init__(
+        self,
+        get_client: _ClientGetter,
+        disk_cache: Cache | None = None,
+        raw_text: bool = True,
+    ) -> None:
+        super().__init__(get_client, disk_cache)
+        self._raw_text = raw_text
+
+    async def _call(
+        self,
         url: str,
         query: str,
-        format: ExtractBodyFormat | None = None,
-        use_safeguard: bool | None = None,
+        format: ExtractBodyFormat | None,
+        use_safeguard: bool | None,
     ) -> str:
-        nonlocal client
-        if client is None:
-            client = AsyncQuercleClient(api_key=api_key)
-        result = (await client.extract(
+        if self._raw_text and format == "json":
+            payload: dict[str, Any] = {"url": url, "query": query, "format": format}
+            if use_safeguard is not None:
+                payload["use_safeguard"] = use_safeguard
+            text = await self._post_json_text("extract", "/v1/extract", payload)
+            if text is not None:
+                return text
+        response = await self._get_client().extract(
             url,
             query,
             format=format,
             use_safeguard=use_safeguard,
-            timeout=timeout,
-        )).result
-        return result if isinstance(result, str) else json.dumps(result)
-
-    # Set docstring dynamically using imported descriptions
-    quercle_extract.__doc__ = f"""Fetch a URL and return chunks relevant to a query.
-
-    Args:
-        url: {tool_metadata["extract"]["parameters"]["url"]}
-        query: {tool_metadata["extract"]["parameters"]["query"]}
-        format: {tool_metadata["extract"]["parameters"]["format"]}
-        use_safeguard: {tool_metadata["extract"]["parameters"]["use_safeguard"]}
+        )
+        if self._raw_text and format == "json":
+            return _response_body(response)
+        return _RESULT_TO_TEXT.get(format, _identity)(response.result)
 
-    Returns:
-        Extracted content chunks relevant to the query.
-    """
+    async def __call__(
+        self,
+        url: str,
+        query: str,
+        format: ExtractBodyFormat | None = None,
+        use_safeguard: bool | None = None,
+    ) -> str:
+        return await self._run(
+            _canonical_key(
+                self.name,
+                url=url,
+                query=query,
+                format=format,
+                use_safeguard=use_safeguard,
+                raw_text=self._raw_text,
+            ),
+            lambda: self._call(url, query, format, use_safeguard),
+        )
 
-    return Tool(
-        quercle_extract,
-        name="quercle_extract",
-        description=tool_metadata["extract"]["description"],
-        takes_ctx=False,
-    )
+    __call__.__name__ = "quercle_extract"
+    __call__.__doc__ = _EXTRACT_DOC
 
 
-def _build_tools_with_shared_client(
+def quercle_search_tool(
     api_key: str | None = None,
-    timeout: float | None = None,
     allowed_domains: list[str] | None = None,
     blocked_domains: list[str] | None = None,
-) -> dict[str, Tool[Any]]:
-    """Build all 5 Quercle tools sharing a single lazy-initialized client."""
-    client: AsyncQuercleClient | None = None
+    timeout: float | None = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
+    client: AsyncQuercleClient | None = None,
+) -> Tool[Any]:
+    """Create a Quercle web search tool for Pydantic AI agents.
 
-    def _get_client() -> AsyncQuercleClient:
-        nonlocal client
-        if client is None:
-            client = AsyncQuercleClient(api_key=api_key)
-        return client
+    Args:
+        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
+        allowed_domains: Only include results from these domains.
+        blocked_domains: Exclude results from these domains.
+        timeout: Request timeout in seconds. Not accepted together with ``client``;
+            configure the timeout on the client instead.
+        cache_ttl: Seconds to keep search results in the in-process cache. 0 disables caching.
+        cache_maxsize: Maximum number of cached search results.
+        client: Existing client to use instead of creating one, e.g. to share a
+            connection pool between tools. ``api_key`` is ignored when given.
 
-    async def _search(query: str) -> str:
-        return (await _get_client().search(
-            query,
-            allowed_domains=allowed_domains,
-            blocked_domains=blocked_domains,
-            timeout=timeout,
-        )).result
+    Returns:
+        A Pydantic AI Tool configured for web search.
+    """
+    return _SearchCallable(
+        _resolve_client(api_key, timeout, client),
+        allowed_domains,
+        blocked_domains,
+        cache_ttl,
+        cache_maxsize,
+    ).as_tool()
 
-    _search.__doc__ = f"""Search the web and get AI-synthesized answers with citations.
+
+def quercle_fetch_tool(
+    api_key: str | None = None,
+    timeout: float | None = None,
+    client: AsyncQuercleClient | None = None,
+) -> Tool[Any]:
+    """Create a Quercle URL fetch tool for Pydantic AI agents.
 
     Args:
-        query: {tool_metadata["search"]["parameters"]["query"]}
+        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
+        timeout: Request timeout in seconds. Not accepted together with ``client``;
+            configure the timeout on the client instead.
+        client: Existing client to use instead of creating one, e.g. to share a
+            connection pool between tools. ``api_key`` is ignored when given.
 
     Returns:
-        AI-synthesized answer with source citations.
+        A Pydantic AI Tool configured for URL fetching.
     """
+    return _FetchCallable(_resolve_client(api_key, timeout, client)).as_tool()
 
-    async def _fetch(url: str, prompt: str) -> str:
-        return (await _get_client().fetch(
-            url=url, prompt=prompt, timeout=timeout
-        )).result
 
-    _fetch.__doc__ = f"""Fetch a URL and analyze its content with AI.
+def quercle_fetch_many_tool(
+    api_key: str | None = None,
+    timeout: float | None = None,
+    client: AsyncQuercleClient | None = None,
+    max_concurrency: int = 8,
+) -> Tool[Any]:
+    """Create a Quercle tool that fetches and analyzes several URLs in one call.
 
     Args:
-        url: {tool_metadata["fetch"]["parameters"]["url"]}
-        prompt: {tool_metadata["fetch"]["parameters"]["prompt"]}
+        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
+        timeout: Request timeout in seconds. Not accepted together with ``client``;
+            configure the timeout on the client instead.
+        client: Existing client to use instead of creating one, e.g. to share a
+            connection pool between tools. ``api_key`` is ignored when given.
+        max_concurrency: Maximum number of URLs fetched at the same time.
 
     Returns:
-        AI-processed analysis of the page content.
+        A Pydantic AI Tool configured for fetching multiple URLs.
     """
+    return _FetchManyCallable(
+        _FetchCallable(_resolve_client(api_key, timeout, client)),
+        max_concurrency=max_concurrency,
+    ).as_tool()
 
-    async def _raw_fetch(
-        url: str,
-        format: RawFetchBodyFormat | None = None,
-        use_safeguard: bool | None = None,
-    ) -> str:
-        result = (await _get_client().raw_fetch(
-            url, format=format, use_safeguard=use_safeguard, timeout=timeout,
-        )).result
-        return result if isinstance(result, str) else json.dumps(result)
 
-    _raw_fetch.__doc__ = f"""Fetch a URL and return raw markdown or HTML.
+def quercle_raw_fetch_tool(
+    api_key: str | None = None,
+    timeout: float | None = None,
+    client: AsyncQuercleClient | None = None,
+) -> Tool[Any]:
+    """Create a Quercle raw URL fetch tool for Pydantic AI agents.
 
     Args:
-        url: {tool_metadata["raw_fetch"]["parameters"]["url"]}
-        format: {tool_metadata["raw_fetch"]["parameters"]["format"]}
-        use_safeguard: {tool_metadata["raw_fetch"]["parameters"]["use_safeguard"]}
+        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
+        timeout: Request timeout in seconds. Not accepted together with ``client``;
+            configure the timeout on the client instead.
+        client: Existing client to use instead of creating one, e.g. to share a
+            connection pool between tools. ``api_key`` is ignored when given.
 
     Returns:
-        Raw page content in the requested format.
+        A Pydantic AI Tool configured for raw URL fetching.
     """
+    return _RawFetchCallable(_resolve_client(api_key, timeout, client)).as_tool()
 
-    async def _raw_search(
-        query: str,
-        format: RawSearchBodyFormat | None = None,
-        use_safeguard: bool | None = None,
-    ) -> str:
-        result = (await _get_client().raw_search(
-            query, format=format, use_safeguard=use_safeguard, timeout=timeout,
-        )).result
-        return result if isinstance(result, str) else json.dumps(result)
 
-    _raw_search.__doc__ = f"""Run web search and return raw results.
+def quercle_raw_search_tool(
+    api_key: str | None = None,
+    timeout: float | None = None,
+    client: AsyncQuercleClient | None = None,
+    raw_text: bool = True,
+) -> Tool[Any]:
+    """Create a Quercle raw web search tool for Pydantic AI agents.
 
     Args:
-        query: {tool_metadata["raw_search"]["parameters"]["query"]}
-        format: {tool_metadata["raw_search"]["parameters"]["format"]}
-        use_safeguard: {tool_metadata["raw_search"]["parameters"]["use_safeguard"]}
+        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
+        timeout: Request timeout in seconds. Not accepted together with ``client``;
+            configure the timeout on the client instead.
+        client: Existing client to use instead of creating one, e.g. to share a
+            connection pool between tools. ``api_key`` is ignored when given.
+        raw_text: Return JSON-format results as the API's response body verbatim
+            (including ``result`` and ``unsafe``) instead of re-serializing the
+            parsed ``result``.
 
     Returns:
-        Raw search results in the requested format.
+        A Pydantic AI Tool configured for raw web search.
     """
+    return _RawSearchCallable(
+        _resolve_client(api_key, timeout, client), raw_text=raw_text
+    ).as_tool()
 
-    async def _extract(
-        url: str,
-        query: str,
-        format: ExtractBodyFormat | None = None,
-        use_safeguard: bool | None = None,
-    ) -> str:
-        result = (await _get_client().extract(
-            url, query, format=format, use_safeguard=use_safeguard, timeout=timeout,
-        )).result
-        return result if isinstance(result, str) else json.dumps(result)
 
-    _extract.__doc__ = f"""Fetch a URL and return chunks relevant to a query.
+def quercle_extract_tool(
+    api_key: str | None = None,
+    timeout: float | None = None,
+    client: AsyncQuercleClient | None = None,
+    raw_text: bool = True,
+) -> Tool[Any]:
+    """Create a Quercle content extraction tool for Pydantic AI agents.
 
     Args:
-        url: {tool_metadata["extract"]["parameters"]["url"]}
-        query: {tool_metadata["extract"]["parameters"]["query"]}
-        format: {tool_metadata["extract"]["parameters"]["format"]}
-        use_safeguard: {tool_metadata["extract"]["parameters"]["use_safeguard"]}
+        api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
+        timeout: Request timeout in seconds. Not accepted together with ``client``;
+            configure the timeout on the client instead.
+        client: Existing client to use instead of creating one, e.g. to share a
+            connection pool between tools. ``api_key`` is ignored when given.
+        raw_text: Return JSON-format results as the API's response body verbatim
+            (including ``result`` and ``unsafe``) instead of re-serializing the
+            parsed ``result``.
 
     Returns:
-        Extracted content chunks relevant to the query.
+        A Pydantic AI Tool configured for content extraction.
     """
+    return _ExtractCallable(
+        _resolve_client(api_key, timeout, client), raw_text=raw_text
+    ).as_tool()
+
+
+# Tool classes in the order tools are returned, keyed by tool name.
+_TOOL_CLASSES: dict[str, type[_QuercleCallable]] = {
+    cls.name: cls
+    for cls in (
+        _SearchCallable,
+        _FetchCallable,
+        _RawFetchCallable,
+        _RawSearchCallable,
+        _ExtractCallable,
+    )
+}
 
-    return {
-        "quercle_search": Tool(
-            _search, name="quercle_search",
-            description=tool_metadata["search"]["description"], takes_ctx=False,
-        ),
-        "quercle_fetch": Tool(
-            _fetch, name="quercle_fetch",
-            description=tool_metadata["fetch"]["description"], takes_ctx=False,
-        ),
-        "quercle_raw_fetch": Tool(
-            _raw_fetch, name="quercle_raw_fetch",
-            description=tool_metadata["raw_fetch"]["description"], takes_ctx=False,
-        ),
-        "quercle_raw_search": Tool(
-            _raw_search, name="quercle_raw_search",
-            description=tool_metadata["raw_search"]["description"], takes_ctx=False,
-        ),
-        "quercle_extract": Tool(
-            _extract, name="quercle_extract",
-            description=tool_metadata["extract"]["description"], takes_ctx=False,
+
+def _build_tools_with_shared_client(
+    get_client: _ClientGetter,
+    options: _SharedToolOptions = _SharedToolOptions(),
+    include: frozenset[str] = frozenset(_TOOL_CLASSES),
+) -> tuple[Tool[Any], ...]:
+    """Build the ``include``d Quercle tools sharing the client returned by ``get_client``."""
+    return tuple(
+        cls.from_options(get_client, options).as_tool()
+        for name, cls in _TOOL_CLASSES.items()
+        if name in include
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_tools(
+    factory: Callable[..., AsyncQuercleClient],
+    api_key: str | None,
+    timeout: float | None,
+    cache_ttl: float,
+    cache_maxsize: int,
+    cache_dir: str | os.PathLike[str] | None,
+    limits: tuple[int | None, int | None, float | None] | None,
+    http2: bool,
+) -> tuple[Tool[Any], ...]:
+    """Build the full tool set once per configuration; see ``quercle_tools``.
+
+    ``factory`` is part of the key so replacing ``client_factory`` (e.g. with a test
+    fake) yields new tools rather than ones holding clients from the old factory.
+    """
+    pool_limits = None
+    if limits is not None:
+        max_connections, max_keepalive_connections, keepalive_expiry = limits
+        pool_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+    return _build_tools_with_shared_client(
+        _lazy_client(api_key, timeout, pool_limits, http2, factory),
+        _SharedToolOptions(
+            cache_ttl=cache_ttl,
+            cache_maxsize=cache_maxsize,
+            disk_cache=_open_disk_cache(cache_dir) if cache_dir is not None else None,
         ),
-    }
+    )
 
 
 def quercle_tools(
     api_key: str | None = None,
     timeout: float | None = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
+    cache_dir: str | os.PathLike[str] | None = None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
 ) -> list[Tool[Any]]:
     """Create all Quercle tools for Pydantic AI agents.
 
-    All tools share a single lazily-initialized client instance.
+    All tools share a lazily-initialized client instance (one per event loop). Calls
+    with the same arguments return the same tool instances, so agents built per
+    request reuse one client and one result cache.
 
     Args:
         api_key: Quercle API key. Falls back to QUERCLE_API_KEY env var if not provided.
         timeout: Request timeout in seconds.
+        cache_ttl: Seconds to keep search results in the in-process cache. 0 disables caching.
+        cache_maxsize: Maximum number of cached search results.
+        cache_dir: Directory for a persistent on-disk result cache shared by all tools.
+            Requires the ``disk`` extra.
+        limits: Connection pool limits for the shared client. Defaults to httpx's
+            limits (100 connections, 20 of them kept alive).
+        http2: Multiplex concurrent requests over a single HTTP/2 connection.
+            Requires the ``http2`` extra.
 
     Returns:
         A list containing all Quercle tools.
     """
-    return list(_build_tools_with_shared_client(
-        api_key=api_key, timeout=timeout,
-    ).values())
+    if http2:
+        _require_http2()
+    # ``httpx.Limits`` isn't hashable, so it's passed to the memoized builder as a tuple.
+    limits_key = None if limits is None else (
+        limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry
+    )
+    return list(_cached_tools(
+        client_factory, api_key, timeout, cache_ttl, cache_maxsize, cache_dir, limits_key, http2
+    ))
 
 
 class QuercleToolset(FunctionToolset):
@@ -427,6 +909,9 @@ class QuercleToolset(FunctionToolset):
         >>> from quercle_pydantic_ai import QuercleToolset
         >>> toolset = QuercleToolset()
         >>> agent = Agent('openai:gpt-4o', toolsets=[toolset])
+
+    In long-running servers, ``await toolset.warmup()`` during startup to move client
+    creation and the TLS handshake off the first tool call.
     """
 
     def __init__(
@@ -441,6 +926,11 @@ class QuercleToolset(FunctionToolset):
         include_extract: bool = True,
         search_allowed_domains: list[str] | None = None,
         search_blocked_domains: list[str] | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        cache_dir: str | os.PathLike[str] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
     ):
         """Initialize the Quercle toolset.
 
@@ -454,14 +944,16 @@ class QuercleToolset(FunctionToolset):
             include_extract: Include the content extraction tool (default: True).
             search_allowed_domains: Only include search results from these domains.
             search_blocked_domains: Exclude search results from these domains.
+            cache_ttl: Seconds to keep search results in the in-process cache.
+                0 disables caching.
+            cache_maxsize: Maximum number of cached search results.
+            cache_dir: Directory for a persistent on-disk result cache shared by all
+                tools, available as ``toolset.cache``. Requires the ``disk`` extra.
+            limits: Connection pool limits for the shared client. Defaults to httpx's
+                limits (100 connections, 20 of them kept alive).
+            http2: Multiplex concurrent requests over a single HTTP/2 connection.
+                Requires the ``http2`` extra.
         """
-        all_tools = _build_tools_with_shared_client(
-            api_key=api_key,
-            timeout=timeout,
-            allowed_domains=search_allowed_domains,
-            blocked_domains=search_blocked_domains,
-        )
-
         include_map = {
             "quercle_search": include_search,
             "quercle_fetch": include_fetch,
@@ -470,6 +962,43 @@ class QuercleToolset(FunctionToolset):
             "quercle_extract": include_extract,
         }
 
-        tools = [t for name, t in all_tools.items() if include_map[name]]
+        if http2:
+            _require_http2()
+        get_client = _lazy_client(api_key, timeout, limits, http2)
+        disk_cache = _open_disk_cache(cache_dir) if cache_dir is not None else None
+        tools = _build_tools_with_shared_client(
+            get_client,
+            _SharedToolOptions(
+                allowed_domains=search_allowed_domains,
+                blocked_domains=search_blocked_domains,
+                cache_ttl=cache_ttl,
+                cache_maxsize=cache_maxsize,
+                disk_cache=disk_cache,
+            ),
+            include=frozenset(name for name, included in include_map.items() if included),
+        )
 
         super().__init__(tools=tools)
+        self._get_client = get_client
+        # Persistent result cache, or None without ``cache_dir``; ``cache.clear()`` empties it.
+        self.cache = disk_cache
+
+    async def warmup(self) -> None:
+        """Create the client and open a connection to the Quercle API ahead of the first call.
+
+        Sends a HEAD request to the API base URL so the connection pool holds an
+        established TCP/TLS connection. Network errors are ignored, since the first
+        tool call will connect as usual; a missing API key still raises.
+        """
+        client = self._get_client()
+        if not isinstance(client, AsyncQuercleClient):
+            return
+        try:
+            await client.client.get_async_httpx_client().head("/")
+        except httpx.HTTPError:
+            pass
+
+    def close(self) -> None:
+        """Close the persistent result cache's database connections, if there is one."""
+        if self.cache is not None:
+            _close_disk_cache(self.cache)
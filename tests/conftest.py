@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from quercle_pydantic_ai.tools import _cached_tools
+
+
+@pytest.fixture(autouse=True)
+def _clear_cached_tools():
+    """Give every test freshly built tools, since ``quercle_tools`` memoizes them."""
+    _cached_tools.cache_clear()
+    yield
+    _cached_tools.cache_clear()
@@ -0,0 +1,41 @@
+"""Tests for the event loop helpers."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+from quercle_pydantic_ai import install_uvloop
+
+
+class TestInstallUvloop:
+    """Tests for install_uvloop."""
+
+    def test_without_uvloop(self):
+        """Test that the default event loop is kept when uvloop isn't installed."""
+        with (
+            patch.object(sys, "version_info", (3, 13)),
+            patch.dict("sys.modules", {"uvloop": None}),
+            patch("asyncio.set_event_loop_policy") as set_policy,
+        ):
+            assert install_uvloop() is False
+            set_policy.assert_not_called()
+
+    def test_with_uvloop(self):
+        """Test that uvloop's event loop policy is installed when available."""
+        uvloop = MagicMock()
+        with (
+            patch.object(sys, "version_info", (3, 13)),
+            patch.dict("sys.modules", {"uvloop": uvloop}),
+            patch("asyncio.set_event_loop_policy") as set_policy,
+        ):
+            assert install_uvloop() is True
+            set_policy.assert_called_once_with(uvloop.EventLoopPolicy.return_value)
+
+    def test_policies_unused_on_python_3_14(self):
+        """Test that no deprecated event loop policy is set on Python 3.14+."""
+        with (
+            patch.object(sys, "version_info", (3, 14)),
+            patch.dict("sys.modules", {"uvloop": MagicMock()}),
+            patch("asyncio.set_event_loop_policy") as set_policy,
+        ):
+            assert install_uvloop() is False
+            set_policy.assert_not_called()
@@ -0,0 +1,68 @@
+"""Tests for the offline testing helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from quercle_pydantic_ai import QuercleToolset, quercle_extract_tool, quercle_tools
+from quercle_pydantic_ai.testing import InMemoryQuercleClient
+
+
+@pytest.fixture
+def fake_client():
+    """Install an in-memory client as the tools' client factory."""
+    fake = InMemoryQuercleClient({("search", "What is Python?"): "A programming language."})
+    with patch("quercle_pydantic_ai.tools.client_factory", fake.factory):
+        yield fake
+
+
+class TestInMemoryQuercleClient:
+    """Tests for InMemoryQuercleClient."""
+
+    @pytest.mark.asyncio
+    async def test_configured_response(self, fake_client):
+        """Test that configured responses are returned by the tools."""
+        tools = {t.name: t for t in quercle_tools()}
+        result = await tools["quercle_search"].function(query="What is Python?")
+
+        assert result == "A programming language."
+        assert fake_client.calls == [("search", "What is Python?")]
+
+    @pytest.mark.asyncio
+    async def test_placeholder_responses_are_deterministic(self, fake_client):
+        """Test that unknown requests get a stable placeholder result."""
+        tools = {t.name: t for t in quercle_tools()}
+        fetch = tools["quercle_fetch"].function
+
+        first = await fetch(url="https://example.com", prompt="Summarize")
+        second = await fetch(url="https://example.com", prompt="Summarize")
+
+        assert first == second == "fetch result for https://example.com | Summarize"
+        assert len(fake_client.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_new_factory_gets_new_tools(self, fake_client):
+        """Test that replacing the factory isn't masked by memoized tools."""
+        search = {t.name: t for t in quercle_tools()}["quercle_search"]
+        await search.function(query="What is Python?")
+
+        other = InMemoryQuercleClient({("search", "What is Python?"): "A snake."})
+        with patch("quercle_pydantic_ai.tools.client_factory", other.factory):
+            search = {t.name: t for t in quercle_tools()}["quercle_search"]
+            assert await search.function(query="What is Python?") == "A snake."
+
+    @pytest.mark.asyncio
+    async def test_json_results(self, fake_client):
+        """Test that JSON formats return the API's response body shape."""
+        fake_client.responses[("extract", "https://example.com", "pricing")] = ["a", "b"]
+        toolset = QuercleToolset()
+
+        result = await toolset.tools["quercle_extract"].function(
+            url="https://example.com", query="pricing", format="json"
+        )
+
+        assert result == '{"result":["a","b"],"unsafe":false}'
+
+        parsed = quercle_extract_tool(raw_text=False)
+        result = await parsed.function(url="https://example.com", query="pricing", format="json")
+        assert result == '["a","b"]'
@@ -1,16 +1,68 @@
 """Tests for Quercle Pydantic AI tools."""
 
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from pydantic_ai.tools import Tool
+from quercle import AsyncQuercleClient, QuercleApiError
+from quercle.models import RawSearchResponse200Type1ResultItem
 
 from quercle_pydantic_ai import (
     QuercleToolset,
+    quercle_fetch_many_tool,
     quercle_fetch_tool,
+    quercle_raw_search_tool,
     quercle_search_tool,
     quercle_tools,
 )
+from quercle_pydantic_ai.tools import _create_client
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    # Keep connections alive so the client's pool holds on to them.
+    protocol_version = "HTTP/1.1"
+    server: "_LocalApi"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        status, body = self.server.responses.get(self.path, (200, b'{"result": "Summary"}'))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _LocalApi(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _ApiHandler)
+        self.base_url = f"http://127.0.0.1:{self.server_port}"
+        # ``(status, body)`` to answer with, by request path.
+        self.responses: dict[str, tuple[int, bytes]] = {}
+
+
+@pytest.fixture
+def local_api(monkeypatch):
+    """Serve the Quercle API from a local HTTP server and point the SDK at it.
+
+    Every endpoint answers ``200 {"result": "Summary"}`` unless overridden in
+    ``local_api.responses``.
+    """
+    server = _LocalApi()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("QUERCLE_BASE_URL", server.base_url)
+    yield server
+    server.shutdown()
+    server.server_close()
 
 
 class TestQuercleSearchTool:
@@ -56,7 +108,6 @@ class TestQuercleSearchTool:
                 "What is Python?",
                 allowed_domains=None,
                 blocked_domains=None,
-                timeout=None,
             )
 
     @pytest.mark.asyncio
@@ -79,9 +130,57 @@ class TestQuercleSearchTool:
                 "TypeScript",
                 allowed_domains=["*.org", "*.edu"],
                 blocked_domains=["spam.com"],
-                timeout=None,
             )
 
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_cached(self):
+        """Test that identical queries are served from the cache."""
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.search.return_value = MagicMock(result="Cached answer")
+            mock_client_class.return_value = mock_client
+
+            tool = quercle_search_tool(api_key="qk_test")
+            first = await tool.function(query="What is Python?")
+            second = await tool.function(query="What is Python?")
+
+            assert first == second == "Cached answer"
+            mock_client.search.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_with_zero_ttl(self):
+        """Test that cache_ttl=0 always hits the API."""
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.search.return_value = MagicMock(result="Fresh answer")
+            mock_client_class.return_value = mock_client
+
+            tool = quercle_search_tool(api_key="qk_test", cache_ttl=0)
+            await tool.function(query="What is Python?")
+            await tool.function(query="What is Python?")
+
+            assert mock_client.search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_accepts_existing_client(self):
+        """Test that the factory uses a caller-provided client."""
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            client = AsyncMock()
+            client.search.return_value = MagicMock(result="Answer")
+
+            search = quercle_search_tool(client=client)
+            await search.function(query="What is Python?")
+
+            mock_client_class.assert_not_called()
+            client.search.assert_called_once_with(
+                "What is Python?", allowed_domains=None, blocked_domains=None,
+            )
+
+    def test_rejects_timeout_with_client(self):
+        """Test that a per-call timeout can't be combined with an existing client."""
+        with pytest.raises(ValueError, match="timeout"):
+            quercle_search_tool(client=AsyncMock(), timeout=5.0)
+
 
 class TestQuercleFetchTool:
     """Tests for quercle_fetch_tool."""
@@ -127,9 +226,159 @@ class TestQuercleFetchTool:
             mock_client.fetch.assert_called_once_with(
                 url="https://example.com",
                 prompt="Summarize this page",
-                timeout=None,
             )
 
+    @pytest.mark.asyncio
+    async def test_accepts_existing_client(self):
+        """Test that the factory uses a caller-provided client."""
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            client = AsyncMock()
+            client.fetch.return_value = MagicMock(result="Summary")
+
+            fetch = quercle_fetch_tool(client=client)
+            await fetch.function(url="https://example.com", prompt="Sum")
+
+            mock_client_class.assert_not_called()
+            client.fetch.assert_called_once_with(url="https://example.com", prompt="Sum")
+
+    @pytest.mark.asyncio
+    async def test_existing_client_reuses_its_connection_pool(self, local_api):
+        """Test that repeated calls through a provided client share one httpx client."""
+        client = AsyncQuercleClient(api_key="qk_test")
+        fetch = quercle_fetch_tool(client=client)
+
+        with patch("httpx.AsyncClient", wraps=httpx.AsyncClient) as async_client_class:
+            for i in range(3):
+                await fetch.function(url=f"https://example.com/{i}", prompt="Sum")
+
+        async_client_class.assert_called_once()
+
+
+class TestQuercleFetchManyTool:
+    """Tests for quercle_fetch_many_tool."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_urls_concurrently_with_limit(self):
+        """Test that URLs are fetched in parallel, bounded by max_concurrency."""
+        active = peak = 0
+
+        async def fetch(url, prompt):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if url.endswith("missing"):
+                raise QuercleApiError("fetch", 404, "Not found")
+            return MagicMock(result=f"Summary of {url}")
+
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.fetch.side_effect = fetch
+            mock_client_class.return_value = mock_client
+
+            tool = quercle_fetch_many_tool(api_key="qk_test", max_concurrency=2)
+            urls = [f"https://example.com/{i}" for i in range(4)] + ["https://example.com/missing"]
+            result = json.loads(await tool.function(urls=urls, prompt="Summarize"))
+
+            assert tool.name == "quercle_fetch_many"
+            assert peak == 2
+            assert [item["url"] for item in result] == urls
+            assert result[0] == {"url": urls[0], "result": f"Summary of {urls[0]}"}
+            assert "error" in result[-1]
+
+    @pytest.mark.asyncio
+    async def test_network_errors_are_reported_per_url(self):
+        """Test that a transport error on one URL doesn't fail the whole call."""
+
+        async def fetch(url, prompt):
+            if url.endswith("slow"):
+                raise httpx.ReadTimeout("")
+            return MagicMock(result="Summary")
+
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.fetch.side_effect = fetch
+            mock_client_class.return_value = mock_client
+
+            tool = quercle_fetch_many_tool(api_key="qk_test")
+            urls = ["https://example.com/ok", "https://example.com/slow"]
+            result = json.loads(await tool.function(urls=urls, prompt="Summarize"))
+
+            assert result == [
+                {"url": urls[0], "result": "Summary"},
+                {"url": urls[1], "error": "ReadTimeout"},
+            ]
+
+
+class TestQuercleRawSearchTool:
+    """Tests for quercle_raw_search_tool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_json_results_are_serialized(self, use_orjson):
+        """Test that structured results are returned as compact JSON."""
+        items = [
+            RawSearchResponse200Type1ResultItem(
+                title="Python", url="https://python.org", content="Café"
+            ),
+        ]
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+        with (
+            patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class,
+            patch("quercle_pydantic_ai.tools.orjson", orjson),
+        ):
+            mock_client = AsyncMock()
+            mock_client.raw_search.return_value = MagicMock(result=items)
+            mock_client_class.return_value = mock_client
+
+            tool = quercle_raw_search_tool(api_key="qk_test", raw_text=False)
+            result = await tool.function(query="python", format="json")
+
+            assert result == (
+                '[{"title":"Python","url":"https://python.org","content":"Café"}]'
+            )
+
+    @pytest.mark.asyncio
+    async def test_json_results_are_passed_through(self, local_api):
+        """Test that JSON-format responses are returned without re-serialization."""
+        body = b'{"result": [{"title": "Python", "url": "https://python.org", "content": "x"}]}'
+        local_api.responses["/v1/raw_search"] = (200, body)
+        tool = quercle_raw_search_tool(client=AsyncQuercleClient(api_key="qk_test"))
+
+        result = await tool.function(query="python", format="json")
+
+        assert result == body.decode()
+
+    @pytest.mark.asyncio
+    async def test_other_clients_use_the_parsed_response(self):
+        """Test that clients other than AsyncQuercleClient go through the SDK methods."""
+        client = AsyncMock()
+        response = MagicMock(result=[])
+        response.unsafe = False
+        client.raw_search.return_value = response
+
+        tool = quercle_raw_search_tool(client=client)
+        result = await tool.function(query="python", format="json")
+
+        assert result == '{"result":[],"unsafe":false}'
+        client.raw_search.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_passthrough_errors_match_the_sdk(self, local_api):
+        """Test that a failed pass-through call raises the same error as the SDK."""
+        body = b'{"detail": "Invalid API key"}'
+        local_api.responses["/v1/raw_search"] = (401, body)
+        tool = quercle_raw_search_tool(client=AsyncQuercleClient(api_key="qk_test"))
+
+        with pytest.raises(QuercleApiError) as exc_info:
+            await tool.function(query="python", format="json")
+
+        assert exc_info.value.operation == "raw_search"
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Invalid API key"
+        assert exc_info.value.payload == {"detail": "Invalid API key"}
+
 
 class TestQuercleTools:
     """Tests for quercle_tools convenience function."""
@@ -153,6 +402,67 @@ class TestQuercleTools:
             "quercle_extract",
         }
 
+    def test_same_configuration_reuses_tools(self):
+        """Test that identical arguments return the same tool instances."""
+        first = quercle_tools(api_key="qk_test", timeout=5)
+        second = quercle_tools(api_key="qk_test", timeout=5)
+        other = quercle_tools(api_key="qk_other", timeout=5)
+
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert first is not second
+        assert not set(map(id, first)) & set(map(id, other))
+
+    def test_tools_work_across_event_loops(self, local_api):
+        """Test that reused tools keep working across separate ``asyncio.run`` calls."""
+
+        for i in range(3):
+            fetch = {t.name: t for t in quercle_tools(api_key="qk_test")}["quercle_fetch"]
+            result = asyncio.run(fetch.function(url=f"https://example.com/{i}", prompt="Sum"))
+            assert result == "Summary"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_are_coalesced(self):
+        """Test that parallel identical calls share a single request."""
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            release = asyncio.Event()
+
+            async def slow_fetch(**kwargs):
+                await release.wait()
+                return MagicMock(result="Shared page summary")
+
+            mock_client = AsyncMock()
+            mock_client.fetch.side_effect = slow_fetch
+            mock_client_class.return_value = mock_client
+
+            fetch = {t.name: t for t in quercle_tools(api_key="qk_test")}["quercle_fetch"]
+            calls = [
+                asyncio.create_task(fetch.function(url="https://example.com", prompt="Sum"))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*calls)
+
+            assert results == ["Shared page summary"] * 3
+            mock_client.fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_tools_share_one_client(self):
+        """Test that all tools reuse a single lazily-created client."""
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.search.return_value = MagicMock(result="Answer")
+            mock_client.fetch.return_value = MagicMock(result="Summary")
+            mock_client_class.return_value = mock_client
+
+            tools = {t.name: t for t in quercle_tools(api_key="qk_test")}
+            mock_client_class.assert_not_called()
+
+            await tools["quercle_search"].function(query="What is Python?")
+            await tools["quercle_fetch"].function(url="https://example.com", prompt="Sum")
+
+            mock_client_class.assert_called_once_with(api_key="qk_test")
+
 
 class TestQuercleToolset:
     """Tests for QuercleToolset class."""
@@ -196,6 +506,94 @@ class TestQuercleToolset:
         )
         assert len(toolset.tools) == 0
 
+    def test_excluded_tools_are_not_built(self):
+        """Test that excluded tools are never constructed."""
+        from quercle_pydantic_ai.tools import _ExtractCallable
+
+        with patch.object(_ExtractCallable, "from_options") as from_options:
+            toolset = QuercleToolset(api_key="qk_test", include_extract=False)
+
+        from_options.assert_not_called()
+        assert "quercle_extract" not in toolset.tools
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_persists_across_toolsets(self, tmp_path):
+        """Test that results cached on disk are reused by a new toolset."""
+        pytest.importorskip("diskcache")
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.fetch.return_value = MagicMock(result="Page summary content")
+            mock_client_class.return_value = mock_client
+
+            for _ in range(2):
+                toolset = QuercleToolset(api_key="qk_test", cache_dir=tmp_path)
+                result = await toolset.tools["quercle_fetch"].function(
+                    url="https://example.com", prompt="Summarize this page"
+                )
+                assert result == "Page summary content"
+                toolset.close()
+
+            mock_client.fetch.assert_called_once()
+
+            assert toolset.cache is not None
+            toolset.cache.clear()
+            await toolset.tools["quercle_fetch"].function(
+                url="https://example.com", prompt="Summarize this page"
+            )
+            assert mock_client.fetch.call_count == 2
+            toolset.close()
+
+    def test_toolsets_share_the_disk_cache_for_a_directory(self, tmp_path):
+        """Test that toolsets pointed at one directory share a single cache instance."""
+        pytest.importorskip("diskcache")
+        first = QuercleToolset(api_key="qk_test", cache_dir=tmp_path)
+        second = QuercleToolset(api_key="qk_test", cache_dir=str(tmp_path / "."))
+
+        assert first.cache is second.cache
+        first.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_touch_disk_once(self, tmp_path):
+        """Test that coalesced calls share one disk cache lookup and store."""
+        pytest.importorskip("diskcache")
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.fetch.return_value = MagicMock(result="Page summary content")
+            mock_client_class.return_value = mock_client
+
+            toolset = QuercleToolset(api_key="qk_test", cache_dir=tmp_path)
+            assert toolset.cache is not None
+            fetch = toolset.tools["quercle_fetch"].function
+            with (
+                patch.object(toolset.cache, "get", wraps=toolset.cache.get) as get,
+                patch.object(toolset.cache, "set", wraps=toolset.cache.set) as set_,
+            ):
+                await asyncio.gather(
+                    *(fetch(url="https://example.com", prompt="Summarize") for _ in range(3))
+                )
+
+            get.assert_called_once()
+            set_.assert_called_once()
+            mock_client.fetch.assert_called_once()
+            toolset.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_keys_ignore_cosmetic_url_differences(self, tmp_path):
+        """Test that equivalent URLs share a cache entry."""
+        pytest.importorskip("diskcache")
+        with patch("quercle_pydantic_ai.tools.AsyncQuercleClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.raw_fetch.return_value = MagicMock(result="# Example")
+            mock_client_class.return_value = mock_client
+
+            toolset = QuercleToolset(api_key="qk_test", cache_dir=tmp_path)
+            raw_fetch = toolset.tools["quercle_raw_fetch"].function
+            await raw_fetch(url="HTTPS://Example.com:443/#intro")
+            await raw_fetch(url="https://example.com", format="markdown")
+
+            mock_client.raw_fetch.assert_called_once()
+            toolset.close()
+
     def test_domain_filter_configuration(self):
         """Test that domain filters can be configured."""
         toolset = QuercleToolset(
@@ -206,3 +604,52 @@ class TestQuercleToolset:
         # Verify toolset was created (filters are applied at call time)
         assert toolset is not None
         assert len(toolset.tools) == 5
+
+    def test_pool_options_reach_httpx_client(self):
+        """Test that connection pool limits are passed to the shared httpx client."""
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+        with patch("importlib.util.find_spec", return_value=MagicMock()):
+            toolset = QuercleToolset(api_key="qk_test", timeout=5, limits=limits, http2=True)
+
+        with patch("httpx.AsyncClient") as async_client_class:
+            toolset._get_client().client.get_async_httpx_client()
+
+        kwargs = async_client_class.call_args.kwargs
+        assert kwargs["timeout"] == httpx.Timeout(5)
+        assert kwargs["limits"] is limits
+        assert kwargs["http2"] is True
+
+    @pytest.mark.parametrize("build", [QuercleToolset, quercle_tools])
+    def test_http2_without_h2_fails_up_front(self, build):
+        """Test that http2=True without the h2 package raises before any tool call."""
+        with (
+            patch("importlib.util.find_spec", return_value=None),
+            pytest.raises(ImportError, match=r"quercle-pydantic-ai\[http2\]"),
+        ):
+            build(api_key="qk_test", http2=True)
+
+    @pytest.mark.asyncio
+    async def test_warmup_creates_client_and_connects(self):
+        """Test that warmup builds the shared client and opens a connection."""
+        with (
+            patch("quercle_pydantic_ai.tools.client_factory", wraps=_create_client) as factory,
+            patch.object(httpx.AsyncClient, "head", autospec=True) as head,
+        ):
+            toolset = QuercleToolset(api_key="qk_test")
+            factory.assert_not_called()
+
+            await toolset.warmup()
+
+            factory.assert_called_once()
+            head.assert_awaited_once()
+            assert head.call_args.args[1] == "/"
+
+    @pytest.mark.asyncio
+    async def test_warmup_skips_other_clients(self):
+        """Test that warmup leaves clients other than AsyncQuercleClient alone."""
+        client = AsyncMock()
+        with patch("quercle_pydantic_ai.tools.client_factory", return_value=client):
+            toolset = QuercleToolset(api_key="qk_test")
+            await toolset.warmup()
+
+        assert client.mock_calls == []